@@ -0,0 +1,62 @@
+"""
+Persistent on-disk TTL cache for slow-changing API responses
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+
+class FileCache:
+    """
+    JSON file cache keyed by (endpoint, params)
+
+    Entries live under {cache_dir}/{endpoint}/{md5(params)}.json as
+    {"ts": <unix time>, "data": <payload>}. Market listings and historical
+    candles change slowly (settled markets never change), so repeated script
+    runs can skip the network entirely on a warm cache.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = Path(cache_dir)
+
+    def _entry_path(self, endpoint: str, params: dict) -> Path:
+        key = hashlib.md5(
+            json.dumps(params, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return self.cache_dir / endpoint / f"{key}.json"
+
+    def get(self, endpoint: str, params: dict, ttl: Optional[float]) -> Optional[Any]:
+        """
+        Return the cached payload if it is younger than ttl seconds
+
+        A ttl of None means the entry never expires (e.g. history for a
+        settled market). Missing or unreadable entries return None.
+        """
+        path = self._entry_path(endpoint, params)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if ttl is not None and time.time() - entry.get("ts", 0) > ttl:
+            return None
+        return entry.get("data")
+
+    def set(self, endpoint: str, params: dict, data: Any) -> None:
+        """Write a payload for (endpoint, params); failures are non-fatal"""
+        path = self._entry_path(endpoint, params)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump({"ts": time.time(), "data": data}, f)
+            # Atomic rename so concurrent readers never see a partial entry
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logging.warning(f"Could not write cache entry {path}: {e}")
@@ -12,7 +12,10 @@ import logging
 class ConfigManager:
     _instance = None
     _config = None
-    
+    # Resolved dotted-path lookups; the monitoring loop reads the same keys
+    # every cycle, so each becomes a single dict hit after the first walk
+    _lookup_cache: Dict[str, Any] = {}
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
@@ -34,13 +37,15 @@ class ConfigManager:
             
             with open(config_path, 'r') as f:
                 self._config = yaml.safe_load(f)
-                
+
             logging.info(f"Configuration loaded from {config_path}")
-            
+
         except Exception as e:
             logging.error(f"Error loading configuration: {e}")
             # Load default configuration
             self._config = self._get_default_config()
+
+        self._lookup_cache.clear()
     
     def _get_default_config(self) -> Dict[str, Any]:
         """Return default configuration if files are not found"""
@@ -84,16 +89,23 @@ class ConfigManager:
         """Get configuration value using dot notation (e.g., 'arbitrage.min_profit_threshold')"""
         if self._config is None:
             self.load_config()
-        
-        keys = key.split('.')
+
+        try:
+            return self._lookup_cache[key]
+        except KeyError:
+            pass
+
         value = self._config
-        
+
         try:
-            for k in keys:
+            for k in key.split('.'):
                 value = value[k]
-            return value
         except (KeyError, TypeError):
+            # Missing keys aren't cached; the result depends on the default
             return default
+
+        self._lookup_cache[key] = value
+        return value
     
     def get_platform_config(self, platform: str) -> Dict[str, Any]:
         """Get platform-specific configuration"""
@@ -125,8 +137,9 @@ class ConfigManager:
                 config[k] = {}
             config = config[k]
         
-        # Set the final value
+        # Set the final value and drop any stale resolved lookups
         config[keys[-1]] = value
+        self._lookup_cache.clear()
         logging.info(f"Updated config: {key} = {value}")
     
     def save_config(self):
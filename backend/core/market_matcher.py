@@ -164,7 +164,7 @@ class MarketMatcher:
                 # Calculate all similarity scores
                 fuzzy_score = self._fuzzy_match(poly_question, kalshi_question)
                 semantic_score = self._semantic_match(poly_question, kalshi_question)
-                keyword_score = self._keyword_match(poly_question, kalshi_question)
+                keyword_score = self._keyword_score_for(poly_market, kalshi_market)
                 
                 # Calculate overall score (weighted average)
                 overall_score = (
@@ -281,7 +281,7 @@ class MarketMatcher:
                         best_method = "semantic"
                 
                 # Try keyword matching
-                keyword_score = self._keyword_match(poly_question, kalshi_question)
+                keyword_score = self._keyword_score_for(poly_market, kalshi_market)
                 if keyword_score > best_score:
                     best_score = keyword_score
                     best_match = kalshi_market
@@ -346,6 +346,21 @@ class MarketMatcher:
             logging.error(f"Error in semantic matching: {e}")
             return 0.0
     
+    def _keyword_score_for(self, market1: Dict, market2: Dict) -> float:
+        """Keyword similarity between two market dicts.
+
+        Markets may carry a precomputed '_tokens' frozenset (cleaned,
+        lowercased, stop-word-free); when both sides have one the score is a
+        direct set Jaccard, skipping the per-pair clean/split/subtract work.
+        """
+        t1 = market1.get('_tokens')
+        t2 = market2.get('_tokens')
+        if t1 and t2:
+            union = len(t1 | t2)
+            return len(t1 & t2) / union if union > 0 else 0.0
+        return self._keyword_match(market1.get('question', ''),
+                                   market2.get('question', ''))
+
     def _keyword_match(self, question1: str, question2: str) -> float:
         """Calculate keyword-based similarity"""
         try:
@@ -4,15 +4,26 @@ Handles interactions with Kalshi's trading API
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Any
 import os
 from dotenv import load_dotenv
 
-# Ensure INFO logs are shown
-logging.basicConfig(level=logging.DEBUG)
+from backend.cache import FileCache
+
 load_dotenv()
 
+# Default to INFO: at DEBUG every candle and every urllib3 wire line gets
+# strftime-formatted even when nobody reads it. Set KALSHI_DEBUG for traces.
+logging.basicConfig(
+    level=logging.DEBUG if os.getenv("KALSHI_DEBUG") else logging.INFO
+)
+logging.getLogger("urllib3").setLevel(logging.WARNING)
+logging.getLogger("requests").setLevel(logging.WARNING)
+
 class KalshiAPI:
     def __init__(self):
         # the Base URL is guaranteed correct as per Kalshi's API documentation
@@ -20,7 +31,31 @@ class KalshiAPI:
         self.api_key = os.getenv("KALSHI_API_KEY", "")
         self.api_secret = os.getenv("KALSHI_API_SECRET", "")
         self.session = requests.Session()
-        
+
+        # Pool connections so repeated calls reuse TCP/TLS handshakes, retry
+        # transient failures, and ask for compressed keep-alive responses
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True,
+                allowed_methods=["GET"],
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "Connection": "keep-alive",
+            "Accept-Encoding": "gzip",
+        })
+
+        # Opt-in persistent response cache for scripts and CI: set
+        # KALSHI_CACHE_DIR to skip the network on repeated runs
+        cache_dir = os.getenv("KALSHI_CACHE_DIR", "")
+        self.cache = FileCache(cache_dir) if cache_dir else None
+
         # Set up authentication headers if credentials are available
         if self.api_key:
             self.session.headers.update({
@@ -45,6 +80,15 @@ class KalshiAPI:
         Returns:
             List of market dictionaries
         """
+        # Market listings churn quickly, so the cached copy is only good for
+        # a few minutes
+        cache_params = {"limit": limit, "archived": archived, "offset": offset,
+                        "order_by": order_by, "ascending": ascending}
+        if self.cache:
+            cached = self.cache.get("markets", cache_params, ttl=300)
+            if cached is not None:
+                return cached
+
         try:
             url = f"{self.base_url}/markets"
             
@@ -91,7 +135,10 @@ class KalshiAPI:
                 processed_markets.sort(key=lambda x: x.get('end_date', ''), reverse=not ascending)
             
             # Return only the requested number after sorting
-            return processed_markets[:limit]
+            result = processed_markets[:limit]
+            if self.cache:
+                self.cache.set("markets", cache_params, result)
+            return result
             
         except requests.RequestException as e:
             logging.error(f"Error fetching markets from Kalshi: {e}")
@@ -139,6 +186,16 @@ class KalshiAPI:
         Get historical price data for a market using the candlesticks endpoint
         Reference: https://trading-api.readme.io/reference/getmarketcandlesticks-1
         """
+        # Settled markets never change, so their history never expires;
+        # open-market history is refreshed hourly
+        cache_params = {"market_id": market_id, "days": days}
+        if self.cache:
+            cached = self.cache.get("history_settled", cache_params, ttl=None)
+            if cached is None:
+                cached = self.cache.get("history_open", cache_params, ttl=3600)
+            if cached is not None:
+                return cached
+
         try:
             logging.debug(f"Getting market history for {market_id}, days: {days}")
             
@@ -253,7 +310,13 @@ class KalshiAPI:
                         })
             
             logging.debug(f"Final processed history: yes points={len(processed_history['token_histories']['yes'])}, no points={len(processed_history['token_histories']['no'])}")
-            
+
+            if self.cache:
+                endpoint = ("history_settled"
+                            if market.get("status") in ("settled", "finalized")
+                            else "history_open")
+                self.cache.set(endpoint, cache_params, processed_history)
+
             return processed_history
             
         except requests.RequestException as e:
@@ -264,7 +327,27 @@ class KalshiAPI:
             logging.error(f"Unexpected error fetching historical data for market {market_id}: {e}")
             logging.debug(f"Exception details: {type(e).__name__}: {str(e)}", exc_info=True)
             return None
-    
+
+    def get_market_histories(self, market_ids: List[str], days: int = 7) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch history for several markets concurrently
+
+        Each get_market_history call is dominated by HTTPS round-trips, so
+        overlapping them over the pooled session collapses N sequential
+        round-trips into roughly one. Results come back in input order, with
+        None for markets whose fetch failed.
+        """
+        if not market_ids:
+            return []
+
+        # Worker count stays within the session adapter's pool_maxsize so
+        # threads reuse pooled connections instead of opening new ones
+        with ThreadPoolExecutor(max_workers=min(8, len(market_ids))) as executor:
+            return list(executor.map(
+                lambda market_id: self.get_market_history(market_id, days),
+                market_ids
+            ))
+
     def get_order_book(self, market_id: str) -> Optional[Dict[str, Any]]:
         """
         Get order book data for a market
@@ -418,3 +501,17 @@ class KalshiAPI:
         except Exception as e:
             logging.error(f"Error fetching token IDs for market {market_id}: {e}")
             return None
+
+
+# Shared client instance. The session (with its keep-alive connection pool)
+# is the expensive part of a KalshiAPI, so scripts and tools should reuse one
+# client rather than constructing their own per call site.
+_kalshi_api: Optional[KalshiAPI] = None
+
+
+def get_kalshi_api() -> KalshiAPI:
+    """Return the shared KalshiAPI instance, creating it on first use"""
+    global _kalshi_api
+    if _kalshi_api is None:
+        _kalshi_api = KalshiAPI()
+    return _kalshi_api
@@ -4,6 +4,8 @@ Handles interactions with Polymarket's CLOB API and Markets API
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 from typing import List, Dict, Optional, Any
 import os
@@ -40,6 +42,26 @@ class PolymarketAPI:
         self.key = os.getenv("PRIVATE_KEY", "")
         self.chain_id = 137
         self.proxy_address = os.getenv("PROXY_ADDRESS", "")
+
+        # Shared session: reuse TCP/TLS connections across the gamma and CLOB
+        # hosts, retry transient failures, and request compressed responses
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True,
+                allowed_methods=["GET"],
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "Connection": "keep-alive",
+            "Accept-Encoding": "gzip",
+        })
     
     def get_markets(self, limit: int = 10, archived: bool = False, offset: int = 0, 
                order_by: str = "volume24hr", ascending: bool = False) -> List[Dict[str, Any]]:
@@ -70,7 +92,7 @@ class PolymarketAPI:
                 "active": "true"
             }
             
-            response = requests.get(url, params=params)
+            response = self.session.get(url, params=params)
             response.raise_for_status()
             
             markets_data = response.json()
@@ -150,7 +172,7 @@ class PolymarketAPI:
         """
         try:
             url = f"{self.gamma_api_url}/markets/{market_id}"
-            response = requests.get(url)
+            response = self.session.get(url)
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
@@ -193,7 +215,7 @@ class PolymarketAPI:
                     "fidelity": fidelity
                 }
                 try:
-                    response = requests.get(base_url, params=params, timeout=10)
+                    response = self.session.get(base_url, params=params, timeout=10)
                     if response.status_code == 200:
                         data = response.json().get("history", [])
                         results[token_id] = data
@@ -256,7 +278,7 @@ class PolymarketAPI:
                         url = f"{self.host}/book"
                         params = {"token_id": token_id}
                         
-                        response = requests.get(url, params=params, timeout=10)
+                        response = self.session.get(url, params=params, timeout=10)
                         if response.status_code == 200:
                             book_data = response.json()
                             
@@ -332,7 +354,7 @@ class PolymarketAPI:
             headers = {"Content-Type": "application/json"}
             logging.debug(f"Sending request to {url} with params: {params}")
             
-            response = requests.post(url, json=params, headers=headers, timeout=15)
+            response = self.session.post(url, json=params, headers=headers, timeout=15)
             
             if response.status_code == 200:
                 books_data = response.json()
@@ -26,14 +26,20 @@ except ImportError as e:
     st.error(f"Arbitrage dashboard not available: {e}")
     ARBITRAGE_AVAILABLE = False
 
-# Configure Streamlit page
-st.set_page_config(
-    page_title="Trading Markets Dashboard",
-    page_icon="📊",
-    layout="wide"
-)
+# Configure Streamlit page; a no-op when streamlit_app.py (the deployment
+# entry point) has already configured it before importing this module
+try:
+    st.set_page_config(
+        page_title="Trading Markets Dashboard",
+        page_icon="📊",
+        layout="wide"
+    )
+except st.errors.StreamlitAPIException:
+    pass
 
-# Apply custom CSS
+# Apply custom CSS. This must run on every rerun: Streamlit prunes elements
+# that aren't re-emitted, so a session-scoped guard would drop the style
+# block on the first widget interaction. The payload is already minified.
 st.markdown(ULTRA_COMPACT_CSS, unsafe_allow_html=True)
 
 def main():
@@ -53,7 +59,7 @@ def main():
     
     selected_page = st.sidebar.radio(
         "Navigation",
-        list(available_pages.keys()),
+        available_pages.keys(),
         index=0
     )
     
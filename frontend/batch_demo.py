@@ -8,9 +8,9 @@ from datetime import datetime
 import sys
 import os
 
-# Add project directories to path
+# Add project root to path so a direct `streamlit run frontend/batch_demo.py`
+# resolves the frontend/backend packages without installing the project
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
 
 from frontend.data import fetch_market_data, process_markets, fetch_order_books_batch, get_api_clients
 from frontend.charts import create_order_book_chart
@@ -2,12 +2,66 @@
 Chart components for the trading markets dashboard
 """
 
+import json
+
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
 
+# History timestamps are epoch-UTC; charts keep showing them in the host's
+# local zone, as datetime.fromtimestamp did before the columnar parse
+_LOCAL_TZ = datetime.now().astimezone().tzinfo
+
+# Plotly rendering degrades badly past a few thousand points, and a 7-day
+# history at minute granularity can easily exceed that per outcome
+_MAX_CHART_POINTS = 500
+
+
+def _lttb_downsample(outcome_data, n_out):
+    """
+    Downsample a time-sorted outcome frame with Largest Triangle Three Buckets
+
+    Keeps the visual shape of the series while capping the number of points
+    Plotly has to serialize and the browser has to render.
+    """
+    n = len(outcome_data)
+    if n_out >= n or n_out < 3:
+        return outcome_data
+
+    x = outcome_data['time'].astype('int64').to_numpy(dtype=np.float64)
+    y = outcome_data['price'].to_numpy(dtype=np.float64)
+
+    # Bucket boundaries for the interior points; first and last are always kept
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+
+        # Average of the following bucket (or the last point for the final one)
+        if i < n_out - 3:
+            avg_x = x[edges[i + 1]:edges[i + 2]].mean()
+            avg_y = y[edges[i + 1]:edges[i + 2]].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+
+        # Pick the point forming the largest triangle with the previous
+        # selection and the next bucket's average
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a]) -
+            (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(area.argmax())
+        indices[i + 1] = a
+
+    return outcome_data.iloc[indices]
+
 
 def create_price_history_chart(historical_data):
     """Create a price history chart from historical data"""
@@ -16,50 +70,50 @@ def create_price_history_chart(historical_data):
     
     token_histories = historical_data['token_histories']
     outcome_token_map = historical_data.get('outcome_token_map', {})
-    chart_data = []
-    
+
+    def _outcome_frame(data, label):
+        """Parse one token's history columnarly instead of per-point"""
+        raw = pd.DataFrame(data or [])
+        if raw.empty or 't' not in raw.columns or 'p' not in raw.columns:
+            return None
+        ts = pd.to_numeric(raw['t'], errors='coerce')
+        # Handle different timestamp formats (seconds vs milliseconds)
+        ts = ts.where(ts <= 1e12, ts / 1000)
+        frame = pd.DataFrame({
+            'time': (pd.to_datetime(ts, unit='s', utc=True)
+                     .dt.tz_convert(_LOCAL_TZ)
+                     .dt.tz_localize(None)),
+            'price': pd.to_numeric(raw['p'], errors='coerce'),
+        })
+        frame['outcome'] = label
+        return frame.dropna(subset=['time', 'price'])
+
     # Try to use outcome names if available, else fallback to token id
+    frames = []
     for outcome_name, token_id in outcome_token_map.items():
-        data = token_histories.get(token_id, [])
-        for point in data:
-            if 't' in point and 'p' in point:
-                timestamp = point['t']
-                # Handle different timestamp formats (seconds vs milliseconds)
-                if timestamp > 1e12:  # If timestamp is in milliseconds
-                    timestamp = timestamp / 1000  # Convert to seconds
-                
-                chart_data.append({
-                    'time': datetime.fromtimestamp(timestamp),
-                    'price': float(point['p']),
-                    'outcome': outcome_name.capitalize()
-                })
-    
+        frame = _outcome_frame(token_histories.get(token_id),
+                               outcome_name.capitalize())
+        if frame is not None and not frame.empty:
+            frames.append(frame)
+
     # If no outcome map, fallback to token ids as outcome labels
-    if not chart_data:
+    if not frames:
         for token_id, data in token_histories.items():
-            for point in (data or []):
-                if 't' in point and 'p' in point:
-                    timestamp = point['t']
-                    # Handle different timestamp formats (seconds vs milliseconds)
-                    if timestamp > 1e12:  # If timestamp is in milliseconds
-                        timestamp = timestamp / 1000  # Convert to seconds
-                    
-                    chart_data.append({
-                        'time': datetime.fromtimestamp(timestamp),
-                        'price': float(point['p']),
-                        'outcome': str(token_id)
-                    })
-    
-    if not chart_data:
+            frame = _outcome_frame(data, str(token_id))
+            if frame is not None and not frame.empty:
+                frames.append(frame)
+
+    if not frames:
         return None
-    
-    df = pd.DataFrame(chart_data)
-    df['time'] = pd.to_datetime(df['time'])
+
+    df = pd.concat(frames, ignore_index=True)
     fig = go.Figure()
     color_map = {'Yes': '#10B981', 'No': '#EF4444'}
     
     for outcome in df['outcome'].unique():
         outcome_data = df[df['outcome'] == outcome].sort_values('time')
+        if len(outcome_data) > _MAX_CHART_POINTS:
+            outcome_data = _lttb_downsample(outcome_data, _MAX_CHART_POINTS)
         fig.add_trace(go.Scatter(
             x=outcome_data['time'].dt.strftime('%Y-%m-%d %H:%M:%S'),
             y=outcome_data['price'],
@@ -244,6 +298,51 @@ def create_volume_chart(top_markets):
     return fig
 
 
+def _cumulative_depth(prices, sizes, descending):
+    """Sort one side of the book by price and accumulate sizes with numpy"""
+    if prices is None or sizes is None or len(prices) == 0:
+        return [], []
+    prices = np.asarray(prices, dtype=np.float64)
+    sizes = np.asarray(sizes, dtype=np.float64)
+    order = np.argsort(-prices if descending else prices, kind='stable')
+    return prices[order], np.cumsum(sizes[order])
+
+
+# Static order-book layout built (and validated by plotly) once at import;
+# create_order_book_chart only fills in the per-call height
+_ORDERBOOK_LAYOUT = go.Layout(
+    margin=dict(l=60, r=20, t=40, b=60),
+    showlegend=True,
+    legend=dict(
+        orientation="h",
+        yanchor="top",
+        y=1.0,
+        xanchor="center",
+        x=0.5,
+        bgcolor="rgba(0,0,0,0)",
+        bordercolor="rgba(255,255,255,0)",
+        borderwidth=0,
+        font=dict(size=10, color="#FFFFFF")
+    ),
+    plot_bgcolor='rgba(0,0,0,0)',
+    paper_bgcolor='rgba(0,0,0,0)',
+    font=dict(color='#FFFFFF', size=11),
+    title=dict(
+        text="Order Book - Liquidity Distribution",
+        font=dict(size=14, color='#FFFFFF'),
+        x=0.5,
+        y=0.98,
+        xanchor='center',
+        yanchor='top'
+    ),
+    template="plotly_dark"
+)
+
+
+# Books mostly don't change between nearby reruns, so memoize the built
+# figure for a few seconds; the hash_func makes the nested book dict hashable
+@st.cache_data(ttl=5, max_entries=128,
+               hash_funcs={dict: lambda d: json.dumps(d, sort_keys=True, default=str)})
 def create_order_book_chart(order_book_data):
     """Create an order book chart showing bids and asks"""
     if not order_book_data or not order_book_data.get('order_books'):
@@ -294,97 +393,117 @@ def create_order_book_chart(order_book_data):
     )
     
     for idx, (outcome, book_data) in enumerate(order_books.items(), 1):
-        bids = book_data.get('bids', [])
-        asks = book_data.get('asks', [])
-        
-        # Process bids (buy orders) - cumulative from highest price down
-        bid_prices = []
-        bid_sizes = []
-        cumulative_bid_size = 0
+        # SoA fast path: callers may supply pre-parsed numeric arrays
+        # (bid_prices/bid_sizes/ask_prices/ask_sizes) instead of per-entry
+        # dicts or [price, size] lists. Numpy sorts and accumulates in C, and
+        # plotly serializes the arrays without a Python list round-trip.
+        soa_input = 'bid_prices' in book_data or 'ask_prices' in book_data
+        if soa_input:
+            bid_prices, bid_sizes = _cumulative_depth(
+                book_data.get('bid_prices'), book_data.get('bid_sizes'),
+                descending=True
+            )
+            ask_prices, ask_sizes = _cumulative_depth(
+                book_data.get('ask_prices'), book_data.get('ask_sizes'),
+                descending=False
+            )
+
+        bids = [] if soa_input else book_data.get('bids', [])
+        asks = [] if soa_input else book_data.get('asks', [])
+
+        if not soa_input:
+            # Process bids (buy orders) - cumulative from highest price down
+            bid_prices = []
+            bid_sizes = []
+            cumulative_bid_size = 0
         
-        # Handle different data formats between platforms
-        try:
-            # Check if this is Kalshi format (list of [price, size]) or Polymarket format (dict)
-            if bids and isinstance(bids[0], list):
-                # Kalshi format: [[price_str, size_str], ...]
-                bid_tuples = []
-                for bid in bids:
-                    if len(bid) >= 2:
-                        try:
-                            price = float(bid[0])
-                            size = float(bid[1])
-                            bid_tuples.append((price, size))
-                        except (ValueError, TypeError):
-                            continue
-                # Sort by price descending (highest first)
-                sorted_bids = sorted(bid_tuples, key=lambda x: x[0], reverse=True)
+            # Handle different data formats between platforms
+            try:
+                # Check if this is Kalshi format (list of [price, size]) or Polymarket format (dict)
+                if bids and isinstance(bids[0], list):
+                    # Kalshi format: [[price_str, size_str], ...]
+                    bid_tuples = []
+                    for bid in bids:
+                        if len(bid) >= 2:
+                            try:
+                                price = float(bid[0])
+                                size = float(bid[1])
+                                bid_tuples.append((price, size))
+                            except (ValueError, TypeError):
+                                continue
+                    # Sort by price descending (highest first)
+                    sorted_bids = sorted(bid_tuples, key=lambda x: x[0], reverse=True)
                 
-                for price, size in sorted_bids:
-                    cumulative_bid_size += size
-                    bid_prices.append(price)
-                    bid_sizes.append(cumulative_bid_size)
+                    for price, size in sorted_bids:
+                        cumulative_bid_size += size
+                        bid_prices.append(price)
+                        bid_sizes.append(cumulative_bid_size)
                     
-            else:
-                # Polymarket format: [{'price': ..., 'size': ...}, ...]
-                sorted_bids = sorted(bids, key=lambda x: float(x['price']), reverse=True)
-                
-                for bid in sorted_bids:
-                    price = float(bid['price'])
-                    size = float(bid['size'])
-                    cumulative_bid_size += size
-                    bid_prices.append(price)
-                    bid_sizes.append(cumulative_bid_size)
-                    
-        except (KeyError, ValueError, IndexError) as e:
-            print(f"Error processing bids for {outcome}: {e}")
-            continue
+                else:
+                    # Polymarket format: [{'price': ..., 'size': ...}, ...].
+                    # np.fromiter parses the strings with numpy's C converter
+                    # and _cumulative_depth sorts/accumulates the whole side
+                    # at once instead of one float() call per level
+                    prices = np.fromiter((bid['price'] for bid in bids),
+                                         dtype=np.float64, count=len(bids))
+                    sizes = np.fromiter((bid['size'] for bid in bids),
+                                        dtype=np.float64, count=len(bids))
+                    bid_prices, bid_sizes = _cumulative_depth(
+                        prices, sizes, descending=True
+                    )
+
+            except (KeyError, ValueError, IndexError) as e:
+                print(f"Error processing bids for {outcome}: {e}")
+                continue
         
-        # Process asks (sell orders) - cumulative from lowest price up
-        ask_prices = []
-        ask_sizes = []
-        cumulative_ask_size = 0
+            # Process asks (sell orders) - cumulative from lowest price up
+            ask_prices = []
+            ask_sizes = []
+            cumulative_ask_size = 0
         
-        # Handle different data formats between platforms
-        try:
-            # Check if this is Kalshi format (list of [price, size]) or Polymarket format (dict)
-            if asks and isinstance(asks[0], list):
-                # Kalshi format: [[price_str, size_str], ...]
-                ask_tuples = []
-                for ask in asks:
-                    if len(ask) >= 2:
-                        try:
-                            price = float(ask[0])
-                            size = float(ask[1])
-                            ask_tuples.append((price, size))
-                        except (ValueError, TypeError):
-                            continue
-                # Sort by price ascending (lowest first)
-                sorted_asks = sorted(ask_tuples, key=lambda x: x[0])
-                
-                for price, size in sorted_asks:
-                    cumulative_ask_size += size
-                    ask_prices.append(price)
-                    ask_sizes.append(cumulative_ask_size)
-                    
-            else:
-                # Polymarket format: [{'price': ..., 'size': ...}, ...]
-                sorted_asks = sorted(asks, key=lambda x: float(x['price']))
+            # Handle different data formats between platforms
+            try:
+                # Check if this is Kalshi format (list of [price, size]) or Polymarket format (dict)
+                if asks and isinstance(asks[0], list):
+                    # Kalshi format: [[price_str, size_str], ...]
+                    ask_tuples = []
+                    for ask in asks:
+                        if len(ask) >= 2:
+                            try:
+                                price = float(ask[0])
+                                size = float(ask[1])
+                                ask_tuples.append((price, size))
+                            except (ValueError, TypeError):
+                                continue
+                    # Sort by price ascending (lowest first)
+                    sorted_asks = sorted(ask_tuples, key=lambda x: x[0])
                 
-                for ask in sorted_asks:
-                    price = float(ask['price'])
-                    size = float(ask['size'])
-                    cumulative_ask_size += size
-                    ask_prices.append(price)
-                    ask_sizes.append(cumulative_ask_size)
+                    for price, size in sorted_asks:
+                        cumulative_ask_size += size
+                        ask_prices.append(price)
+                        ask_sizes.append(cumulative_ask_size)
                     
-        except (KeyError, ValueError, IndexError) as e:
-            print(f"Error processing asks for {outcome}: {e}")
-            continue
+                else:
+                    # Polymarket format: same batch parse as the bid side
+                    prices = np.fromiter((ask['price'] for ask in asks),
+                                         dtype=np.float64, count=len(asks))
+                    sizes = np.fromiter((ask['size'] for ask in asks),
+                                        dtype=np.float64, count=len(asks))
+                    ask_prices, ask_sizes = _cumulative_depth(
+                        prices, sizes, descending=False
+                    )
+
+            except (KeyError, ValueError, IndexError) as e:
+                print(f"Error processing asks for {outcome}: {e}")
+                continue
         
-        # Add bid side (green, left side)
-        if bid_prices and bid_sizes:
+        # Add bid side (green, left side); len() keeps the check valid for
+        # both list and numpy inputs
+        if len(bid_prices) and len(bid_sizes):
+            # Scattergl: WebGL rendering keeps deep books (hundreds of price
+            # levels) responsive where SVG Scatter bogs down
             fig.add_trace(
-                go.Scatter(
+                go.Scattergl(
                     x=bid_prices,
                     y=bid_sizes,
                     mode='lines',
@@ -399,9 +518,9 @@ def create_order_book_chart(order_book_data):
             )
         
         # Add ask side (red, right side)
-        if ask_prices and ask_sizes:
+        if len(ask_prices) and len(ask_sizes):
             fig.add_trace(
-                go.Scatter(
+                go.Scattergl(
                     x=ask_prices,
                     y=ask_sizes,
                     mode='lines',
@@ -497,33 +616,7 @@ def create_order_book_chart(order_book_data):
         )
     )
     
-    fig.update_layout(
-        height=height,
-        margin=dict(l=60, r=20, t=40, b=60),
-        showlegend=True,
-        legend=dict(
-            orientation="h",
-            yanchor="top",
-            y=1.0,
-            xanchor="center",
-            x=0.5,
-            bgcolor="rgba(0,0,0,0)",
-            bordercolor="rgba(255,255,255,0)",
-            borderwidth=0,
-            font=dict(size=10, color="#FFFFFF")
-        ),
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='#FFFFFF', size=11),
-        title=dict(
-            text="Order Book - Liquidity Distribution",
-            font=dict(size=14, color='#FFFFFF'),
-            x=0.5,
-            y=0.98,
-            xanchor='center',
-            yanchor='top'
-        ),
-        template="plotly_dark"
-    )
-    
+    fig.update_layout(_ORDERBOOK_LAYOUT)
+    fig.update_layout(height=height)
+
     return fig
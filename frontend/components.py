@@ -145,20 +145,19 @@ def render_market_details(market):
             
             # Use container to give charts more space in the UI
             with st.container():
-                # Create tabs with better styling
-                tab_style = """
-                <style>
-                button[data-baseweb="tab"] {
-                    font-size: 1.1rem;
-                    font-weight: 500;
-                }
-                </style>
-                """
-                st.markdown(tab_style, unsafe_allow_html=True)
-                
-                price_tab, depth_tab = st.tabs(["Price History", "Order Book Depth"])
-                
-                with price_tab:
+                # st.tabs renders the contents of every tab on each rerun, so both
+                # figures get built even though only one is visible. A radio keyed
+                # per market keeps the selection in session state and lets us build
+                # only the chart the user is actually looking at.
+                selected_view = st.radio(
+                    "View",
+                    ["Price History", "Order Book Depth"],
+                    key=f"tab_{market_id}",
+                    horizontal=True,
+                    label_visibility="collapsed"
+                )
+
+                if selected_view == "Price History":
                     st.markdown("### 7-Day Price History")
                     with st.spinner("Loading price history data..."):
                         historical_data = api_client.get_market_history(market_id, days=7)
@@ -171,8 +170,8 @@ def render_market_details(market):
                                 st.info("No historical price data available for this market")
                         else:
                             st.info("No historical data available")
-                
-                with depth_tab:
+
+                else:
                     st.markdown("## Order Book Depth Chart")
                     with st.spinner("Loading order book data..."):
                         # Import the batch fetching function
@@ -201,81 +200,83 @@ def render_market_details(market):
                                 # Last resort fallback to individual API request
                                 st.warning(f"⚠️ Falling back to individual {platform} API request")
                                 order_book_data = api_client.get_order_book(market_id)
+
+                    # Render outside the spinner so the summary metrics paint as
+                    # soon as data is available, with the chart filling in below
+                    if order_book_data and order_book_data.get('order_books'):
+                        # Add a summary of the order book
+                        total_bids = 0
+                        total_asks = 0
                         
-                        if order_book_data and order_book_data.get('order_books'):
-                            # Add a summary of the order book
-                            total_bids = 0
-                            total_asks = 0
-                            
-                            for outcome, data in order_book_data['order_books'].items():
-                                # Handle different formats between Polymarket and Kalshi
-                                bids = data.get('bids', [])
-                                asks = data.get('asks', [])
-                                
-                                # Process bids - handle both formats
-                                for bid in bids:
-                                    try:
-                                        if isinstance(bid, list) and len(bid) >= 2:
-                                            # Kalshi format: [price, size] 
-                                            total_bids += float(bid[1])
-                                        elif isinstance(bid, dict):
-                                            # Polymarket format: {'price': ..., 'size': ...}
-                                            total_bids += float(bid.get('size', 0))
-                                    except (ValueError, TypeError):
-                                        pass
-                                
-                                # Process asks - handle both formats  
-                                for ask in asks:
-                                    try:
-                                        if isinstance(ask, list) and len(ask) >= 2:
-                                            # Kalshi format: [price, size]
-                                            total_asks += float(ask[1])
-                                        elif isinstance(ask, dict):
-                                            # Polymarket format: {'price': ..., 'size': ...}
-                                            total_asks += float(ask.get('size', 0))
-                                    except (ValueError, TypeError):
-                                        pass
+                        for outcome, data in order_book_data['order_books'].items():
+                            # Handle different formats between Polymarket and Kalshi
+                            bids = data.get('bids', [])
+                            asks = data.get('asks', [])
                             
-                            # Large formatted dollar values for metrics
-                            formatted_bids = f"${total_bids/1000000:.1f}M" if total_bids >= 1000000 else f"${total_bids/1000:.1f}K" 
-                            formatted_asks = f"${total_asks/1000000:.1f}M" if total_asks >= 1000000 else f"${total_asks/1000:.1f}K"
+                            # Process bids - handle both formats
+                            for bid in bids:
+                                try:
+                                    if isinstance(bid, list) and len(bid) >= 2:
+                                        # Kalshi format: [price, size] 
+                                        total_bids += float(bid[1])
+                                    elif isinstance(bid, dict):
+                                        # Polymarket format: {'price': ..., 'size': ...}
+                                        total_bids += float(bid.get('size', 0))
+                                except (ValueError, TypeError):
+                                    pass
                             
-                            # Custom metric styling
-                            metric_style = """
-                            <style>
-                            [data-testid="stMetricValue"] {
-                                font-size: 2rem !important;
-                                font-weight: 700 !important;
-                                color: white !important;
-                            }
-                            [data-testid="stMetricLabel"] {
-                                font-size: 1rem !important;
-                                font-weight: 600 !important;
-                            }
-                            </style>
-                            """
-                            st.markdown(metric_style, unsafe_allow_html=True)
-                            
-                            # Display summary metrics
-                            col1, col2 = st.columns(2)
-                            with col1:
-                                st.metric("Total Bid Volume", formatted_bids)
-                            with col2:
-                                st.metric("Total Ask Volume", formatted_asks)
-                            
-                            # Create and display the chart
-                            fig = create_order_book_chart(order_book_data)
-                            if fig:
-                                st.plotly_chart(fig, use_container_width=True, config={
-                                    "displayModeBar": True,
-                                    "displaylogo": False,
-                                    "modeBarButtonsToAdd": ["zoom2d", "pan2d", "resetScale2d"],
-                                    "modeBarButtonsToRemove": ["lasso2d", "select2d", "toggleSpikelines", "autoScale2d"]
-                                })
-                            else:
-                                st.info("Could not generate order book chart with the available data")
+                            # Process asks - handle both formats  
+                            for ask in asks:
+                                try:
+                                    if isinstance(ask, list) and len(ask) >= 2:
+                                        # Kalshi format: [price, size]
+                                        total_asks += float(ask[1])
+                                    elif isinstance(ask, dict):
+                                        # Polymarket format: {'price': ..., 'size': ...}
+                                        total_asks += float(ask.get('size', 0))
+                                except (ValueError, TypeError):
+                                    pass
+                        
+                        # Large formatted dollar values for metrics
+                        formatted_bids = format_volume(total_bids)
+                        formatted_asks = format_volume(total_asks)
+
+                        # Custom metric styling
+                        metric_style = """
+                        <style>
+                        [data-testid="stMetricValue"] {
+                            font-size: 2rem !important;
+                            font-weight: 700 !important;
+                            color: white !important;
+                        }
+                        [data-testid="stMetricLabel"] {
+                            font-size: 1rem !important;
+                            font-weight: 600 !important;
+                        }
+                        </style>
+                        """
+                        st.markdown(metric_style, unsafe_allow_html=True)
+                        
+                        # Display summary metrics
+                        col1, col2 = st.columns(2)
+                        with col1:
+                            st.metric("Total Bid Volume", formatted_bids)
+                        with col2:
+                            st.metric("Total Ask Volume", formatted_asks)
+                        
+                        # Create and display the chart
+                        fig = create_order_book_chart(order_book_data)
+                        if fig:
+                            st.plotly_chart(fig, use_container_width=True, config={
+                                "displayModeBar": True,
+                                "displaylogo": False,
+                                "modeBarButtonsToAdd": ["zoom2d", "pan2d", "resetScale2d"],
+                                "modeBarButtonsToRemove": ["lasso2d", "select2d", "toggleSpikelines", "autoScale2d"]
+                            })
                         else:
-                            st.info(f"No order book data available for this {platform} market")
+                            st.info("Could not generate order book chart with the available data")
+                    else:
+                        st.info(f"No order book data available for this {platform} market")
                 
         except Exception as e:
             st.caption(f"Chart unavailable: {str(e)[:30]}...")
@@ -2,15 +2,12 @@
 Data fetching and processing functions
 """
 
-import streamlit as st
-import sys
-import os
+import json
 
-# Add backend to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+import streamlit as st
 
-from polymarket_api import PolymarketAPI
-from kalshi_api import KalshiAPI
+from backend.polymarket_api import PolymarketAPI
+from backend.kalshi_api import KalshiAPI
 
 
 @st.cache_resource
@@ -89,6 +86,7 @@ def fetch_order_books_batch(markets, max_markets=None):
         all_token_ids = []
         market_token_map = {}  # Maps token_ids back to their market_id
         market_outcome_map = {}  # Maps market_id to outcome names
+        token_index_map = {}  # Maps token_id to its index within its market's token list
         
         for market in poly_markets_to_process:
             market_id = market.get('id')
@@ -103,7 +101,6 @@ def fetch_order_books_batch(markets, max_markets=None):
             outcome_names = []
             if market_details:
                 outcomes = market_details.get('outcomes')
-                import json
                 if outcomes:
                     if isinstance(outcomes, str):
                         try:
@@ -115,13 +112,16 @@ def fetch_order_books_batch(markets, max_markets=None):
                         
             market_outcome_map[market_id] = outcome_names
             
-            # Track which token belongs to which market
-            for token_id in token_ids:
+            # Track which token belongs to which market, and where it sits in
+            # the market's token list so outcome names resolve in O(1) later
+            for idx, token_id in enumerate(token_ids):
                 all_token_ids.append(token_id)
                 market_token_map[token_id] = market_id
+                token_index_map[token_id] = idx
         
         if all_token_ids:
-            # Fetch all books in a single batch request
+            # Fetch all books in a single batch request over the client's
+            # pooled session, which carries the retry/backoff policy
             all_books_data = polymarket_api.get_books(all_token_ids)
             if all_books_data:
                 # Organize results by market
@@ -139,22 +139,20 @@ def fetch_order_books_batch(markets, max_markets=None):
                         
                     # Get outcome names for this market
                     outcome_names = market_outcome_map.get(market_id, [])
-                    
-                    # Find index of this token in the market's token list
-                    token_ids = polymarket_api.get_token_ids_for_market(market_id)
-                    if token_ids:
-                        try:
-                            idx = token_ids.index(token_id)
-                            outcome_name = outcome_names[idx] if idx < len(outcome_names) else f"Token_{idx}"
-                        except ValueError:
-                            outcome_name = f"Unknown_{token_id[-4:]}"
-                            
-                        # Add this book to the market's order books
-                        results[market_id]['order_books'][outcome_name] = {
-                            'token_id': token_id,
-                            'bids': book_data.get('bids', []),
-                            'asks': book_data.get('asks', [])
-                        }
+
+                    # Look up the token's position from the index built above
+                    idx = token_index_map.get(token_id)
+                    if idx is not None:
+                        outcome_name = outcome_names[idx] if idx < len(outcome_names) else f"Token_{idx}"
+                    else:
+                        outcome_name = f"Unknown_{token_id[-4:]}"
+
+                    # Add this book to the market's order books
+                    results[market_id]['order_books'][outcome_name] = {
+                        'token_id': token_id,
+                        'bids': book_data.get('bids', []),
+                        'asks': book_data.get('asks', [])
+                    }
     
     # Process Kalshi markets
     if kalshi_markets_to_process:
@@ -3,9 +3,11 @@ Arbitrage opportunities dashboard page
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import time
 import sys
@@ -25,15 +27,87 @@ except ImportError as e:
     st.error(f"Backend modules not available: {e}")
     BACKEND_AVAILABLE = False
 
+# Every widget interaction reruns the whole script, so backend/DB fetches are
+# cached for one monitoring interval instead of being re-issued per rerun
+_CACHE_TTL = config.get("monitoring.update_interval", 30) if BACKEND_AVAILABLE else 30
+
+
+@st.cache_data(ttl=_CACHE_TTL)
+def _cached_similarities(top_n):
+    return monitor.get_market_similarities(top_n=top_n)
+
+
+# show_spinner=False on the prefetched functions below: they are also called
+# from worker threads that have no ScriptRunContext for the spinner element
+@st.cache_data(ttl=_CACHE_TTL, show_spinner=False)
+def _cached_opportunities():
+    return monitor.get_current_opportunities()
+
+
+@st.cache_data(ttl=_CACHE_TTL, show_spinner=False)
+def _cached_metrics(time_period_hours):
+    return monitor.get_performance_metrics(time_period_hours)
+
+
+@st.cache_resource
+def get_db():
+    """One DatabaseManager per process, so connections survive reruns"""
+    return DatabaseManager()
+
+
+@st.cache_data(ttl=_CACHE_TTL, show_spinner=False)
+def _cached_recent_opportunities(limit):
+    return get_db().get_recent_opportunities(limit=limit)
+
+
+def _truncate(series, limit):
+    """Vectorized '...'-style truncation of a string Series"""
+    return (series.str.slice(0, limit) + '...').where(series.str.len() > limit, series)
+
+
+@st.cache_data(hash_funcs={list: lambda sims: tuple(
+    (s['polymarket_id'], s['kalshi_id'], s['overall_score']) for s in sims)})
+def _build_sim_df(similarities):
+    """Build the similarity DataFrame once per analyzed payload, not per rerun"""
+    sim_df = pd.DataFrame(similarities)
+    sim_df['poly_question_short'] = _truncate(sim_df['polymarket_question'], 60)
+    sim_df['kalshi_question_short'] = _truncate(sim_df['kalshi_question'], 60)
+    return sim_df
+
+
+def _prefetch_dashboard_data():
+    """Warm the cached fetchers concurrently before the sections render.
+
+    Each section hits a different backend/DB call; issuing them in parallel
+    means total wait is the slowest fetch instead of the sum of all three.
+    Results land in st.cache_data, so the sections below get cache hits.
+    Similarities are deliberately excluded: the correlation analysis is the
+    most expensive backend call and only runs when the user asks for it.
+    """
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        futures = [
+            ex.submit(_cached_opportunities),
+            ex.submit(lambda: _cached_metrics(24)),
+            ex.submit(lambda: _cached_recent_opportunities(limit=100)),
+        ]
+        for future in futures:
+            try:
+                future.result()
+            except Exception:
+                # The owning section reports its own fetch errors
+                pass
+
 
 def render_arbitrage_dashboard():
     """Main arbitrage dashboard page"""
     st.title("🔄 Arbitrage Opportunities Dashboard")
-    
+
     if not BACKEND_AVAILABLE:
         st.error("Backend system not available. Please check your configuration and dependencies.")
         return
-    
+
+    _prefetch_dashboard_data()
+
     # Control panel
     render_control_panel()
     
@@ -73,6 +147,7 @@ def render_control_panel():
         if st.button("🔄 Force Update"):
             with st.spinner("Running immediate scan..."):
                 opportunities = monitor.force_update()
+                _cached_opportunities.clear()
                 st.success(f"Found {len(opportunities)} opportunities")
     
     with col4:
@@ -88,64 +163,69 @@ def render_control_panel():
 def render_config_settings():
     """Render configuration settings"""
     st.subheader("Configuration")
+
+    # A form batches all six widgets into a single rerun on submit instead of
+    # one full rerun per slider drag
+    with st.form("config_form"):
+        col1, col2 = st.columns(2)
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.write("**Arbitrage Settings**")
+        with col1:
+            st.write("**Arbitrage Settings**")
         
-        min_profit = st.slider(
-            "Minimum Profit Threshold (%)",
-            min_value=1.0,
-            max_value=20.0,
-            value=config.get("arbitrage.min_profit_threshold", 0.05) * 100,
-            step=0.5
-        )
+            min_profit = st.slider(
+                "Minimum Profit Threshold (%)",
+                min_value=1.0,
+                max_value=20.0,
+                value=config.get("arbitrage.min_profit_threshold", 0.05) * 100,
+                step=0.5
+            )
         
-        max_position = st.number_input(
-            "Maximum Position Size ($)",
-            min_value=100,
-            max_value=10000,
-            value=config.get("arbitrage.max_position_size", 1000),
-            step=100
-        )
+            max_position = st.number_input(
+                "Maximum Position Size ($)",
+                min_value=100,
+                max_value=10000,
+                value=config.get("arbitrage.max_position_size", 1000),
+                step=100
+            )
         
-        slippage_buffer = st.slider(
-            "Slippage Buffer (%)",
-            min_value=0.5,
-            max_value=5.0,
-            value=config.get("arbitrage.slippage_buffer", 0.02) * 100,
-            step=0.1
-        )
+            slippage_buffer = st.slider(
+                "Slippage Buffer (%)",
+                min_value=0.5,
+                max_value=5.0,
+                value=config.get("arbitrage.slippage_buffer", 0.02) * 100,
+                step=0.1
+            )
     
-    with col2:
-        st.write("**Monitoring Settings**")
+        with col2:
+            st.write("**Monitoring Settings**")
         
-        update_interval = st.slider(
-            "Update Interval (seconds)",
-            min_value=15,
-            max_value=300,
-            value=config.get("monitoring.update_interval", 30),
-            step=5
-        )
+            update_interval = st.slider(
+                "Update Interval (seconds)",
+                min_value=15,
+                max_value=300,
+                value=config.get("monitoring.update_interval", 30),
+                step=5
+            )
         
-        batch_size = st.slider(
-            "Batch Size",
-            min_value=5,
-            max_value=50,
-            value=config.get("monitoring.batch_size", 20),
-            step=5
-        )
+            batch_size = st.slider(
+                "Batch Size",
+                min_value=5,
+                max_value=50,
+                value=config.get("monitoring.batch_size", 20),
+                step=5
+            )
         
-        min_alert_profit = st.slider(
-            "Minimum Alert Profit (%)",
-            min_value=5.0,
-            max_value=50.0,
-            value=config.get("alerts.min_profit_for_alert", 0.1) * 100,
-            step=1.0
-        )
+            min_alert_profit = st.slider(
+                "Minimum Alert Profit (%)",
+                min_value=5.0,
+                max_value=50.0,
+                value=config.get("alerts.min_profit_for_alert", 0.1) * 100,
+                step=1.0
+            )
     
-    if st.button("💾 Save Configuration"):
+        submitted = st.form_submit_button("💾 Save Configuration")
+
+    if submitted:
         # Update configuration
         config.update_config("arbitrage.min_profit_threshold", min_profit / 100)
         config.update_config("arbitrage.max_position_size", max_position)
@@ -163,6 +243,9 @@ def render_config_settings():
         st.success("Configuration updated!")
 
 
+# run_every reruns only this fragment, so the "seconds ago" caption stays
+# live without the whole page polling
+@st.fragment(run_every=5)
 def render_monitoring_status():
     """Render monitoring status information"""
     st.subheader("📊 Monitoring Status")
@@ -210,7 +293,7 @@ def render_market_correlations():
         with col2:
             if st.button("🔍 Analyze Correlations"):
                 with st.spinner("Analyzing market similarities..."):
-                    similarities = monitor.get_market_similarities(top_n=20)
+                    similarities = _cached_similarities(top_n=20)
                     st.session_state.similarities = similarities
     
     if 'similarities' in st.session_state and st.session_state.similarities:
@@ -219,6 +302,7 @@ def render_market_correlations():
         st.info("👆 Click 'Analyze Correlations' to see how markets are matched during batching.")
 
 
+@st.fragment
 def render_similarity_analysis(similarities):
     """Render detailed similarity analysis"""
     
@@ -244,96 +328,89 @@ def render_similarity_analysis(similarities):
     with col3:
         show_excluded = st.checkbox("Show Excluded Pairs", value=False)
     
-    # Filter similarities
-    filtered_similarities = []
-    for sim in similarities:
-        if sim['overall_score'] >= min_score:
-            if match_type_filter == "All" or sim['match_type'] == match_type_filter:
-                if show_excluded or not sim['is_excluded']:
-                    filtered_similarities.append(sim)
-    
-    if not filtered_similarities:
+    # Filter with vectorized masks instead of a per-item Python loop
+    sim_df = _build_sim_df(similarities)
+    mask = sim_df['overall_score'] >= min_score
+    if match_type_filter != "All":
+        mask &= sim_df['match_type'] == match_type_filter
+    if not show_excluded:
+        mask &= ~sim_df['is_excluded']
+    filtered_df = sim_df[mask]
+
+    if filtered_df.empty:
         st.warning("No similarities found with the current filters.")
         return
-    
-    # Summary metrics
+
+    # Summary metrics from single vectorized passes rather than Python
+    # generator scans over dict records
     col1, col2, col3, col4 = st.columns(4)
-    
+
     with col1:
-        st.metric("Total Pairs", len(filtered_similarities))
-    
+        st.metric("Total Pairs", len(filtered_df))
+
     with col2:
-        avg_score = sum(sim['overall_score'] for sim in filtered_similarities) / len(filtered_similarities)
-        st.metric("Avg Similarity", f"{avg_score:.3f}")
-    
+        st.metric("Avg Similarity", f"{filtered_df['overall_score'].mean():.3f}")
+
     with col3:
-        excluded_count = sum(1 for sim in filtered_similarities if sim['is_excluded'])
-        st.metric("Excluded Pairs", excluded_count)
-    
+        st.metric("Excluded Pairs", int(filtered_df['is_excluded'].sum()))
+
     with col4:
-        high_similarity = sum(1 for sim in filtered_similarities if sim['overall_score'] > 0.7)
-        st.metric("High Similarity", high_similarity)
+        st.metric("High Similarity", int((filtered_df['overall_score'] > 0.7).sum()))
     
     # Visualization
-    render_similarity_charts(filtered_similarities)
-    
+    render_similarity_charts(filtered_df)
+
     # Detailed table
-    render_similarity_table(filtered_similarities)
+    render_similarity_table(filtered_df)
 
 
-def render_similarity_charts(similarities):
+def render_similarity_charts(df):
     """Render similarity visualization charts"""
-    
-    # Create DataFrame for plotting
-    df = pd.DataFrame(similarities)
-    
+
     # Score distribution chart
     col1, col2 = st.columns(2)
     
+    # Both distributions are static summaries, so native st.bar_chart beats a
+    # full plotly round-trip per rerun
     with col1:
         st.subheader("📊 Score Distribution")
-        
-        fig_hist = px.histogram(
-            df, 
-            x='overall_score', 
-            nbins=20,
-            title="Overall Similarity Score Distribution",
-            labels={'overall_score': 'Similarity Score', 'count': 'Number of Pairs'}
-        )
-        fig_hist.update_layout(height=300)
-        st.plotly_chart(fig_hist, use_container_width=True)
-    
+
+        counts, edges = np.histogram(df['overall_score'], bins=20)
+        st.bar_chart(pd.Series(counts, index=edges[:-1].round(3), name='Pairs'))
+
     with col2:
         st.subheader("🎯 Match Type Distribution")
-        
-        match_counts = df['match_type'].value_counts()
-        fig_pie = px.pie(
-            values=match_counts.values,
-            names=match_counts.index,
-            title="Match Type Distribution"
-        )
-        fig_pie.update_layout(height=300)
-        st.plotly_chart(fig_pie, use_container_width=True)
+
+        st.bar_chart(df['match_type'].value_counts())
     
     # Scatter plot of different scoring methods
     st.subheader("📈 Similarity Score Comparison")
-    
+
+    # WebGL rendering plus a point cap keeps the scatter responsive when the
+    # pair count grows; hover text is truncated once, not per render
+    df_plot = df.sample(2000, random_state=0) if len(df) > 2000 else df
+
+    # Plain numpy arrays serialize to JSON faster than pandas Series, and
+    # customdata keeps the truncated question out of the visible text payload
+    hover_text = df_plot['polymarket_question'].str.slice(0, 50).to_numpy()
+    overall = df_plot['overall_score'].to_numpy()
+
     fig_scatter = go.Figure()
-    
+
     # Add fuzzy vs semantic scores
-    fig_scatter.add_trace(go.Scatter(
-        x=df['fuzzy_score'],
-        y=df['semantic_score'],
+    fig_scatter.add_trace(go.Scattergl(
+        x=df_plot['fuzzy_score'].to_numpy(),
+        y=df_plot['semantic_score'].to_numpy(),
         mode='markers',
         name='Fuzzy vs Semantic',
-        text=df['polymarket_question'].str[:50] + '...',
+        customdata=hover_text,
         hovertemplate='<b>Fuzzy Score:</b> %{x:.3f}<br>' +
                      '<b>Semantic Score:</b> %{y:.3f}<br>' +
-                     '<b>Question:</b> %{text}<br>' +
+                     '<b>Question:</b> %{customdata}...<br>' +
                      '<extra></extra>',
         marker=dict(
-            size=df['overall_score'] * 20,
-            color=df['overall_score'],
+            size=overall * 20,
+            color=overall,
             colorscale='Viridis',
             showscale=True,
             colorbar=dict(title="Overall Score")
@@ -350,47 +427,60 @@ def render_similarity_charts(similarities):
     st.plotly_chart(fig_scatter, use_container_width=True)
 
 
-def render_similarity_table(similarities):
+def render_similarity_table(sim_df):
     """Render detailed similarity table"""
     st.subheader("📋 Detailed Similarity Analysis")
-    
-    # Prepare data for display
-    display_data = []
-    
-    for sim in similarities:
-        display_data.append({
-            'Polymarket Question': sim['polymarket_question'][:60] + '...' if len(sim['polymarket_question']) > 60 else sim['polymarket_question'],
-            'Kalshi Question': sim['kalshi_question'][:60] + '...' if len(sim['kalshi_question']) > 60 else sim['kalshi_question'],
-            'Overall Score': f"{sim['overall_score']:.3f}",
-            'Fuzzy': f"{sim['fuzzy_score']:.3f}",
-            'Semantic': f"{sim['semantic_score']:.3f}",
-            'Keyword': f"{sim['keyword_score']:.3f}",
-            'Match Type': sim['match_type'],
-            'Common Keywords': ', '.join(sim['common_keywords'][:3]) if sim['common_keywords'] else 'None',
-            'Similarity Reasons': '; '.join(sim['similarity_reasons'][:2]) if sim['similarity_reasons'] else 'None',
-            'Status': '❌ Excluded' if sim['is_excluded'] else '✅ Active'
-        })
-    
-    df_display = pd.DataFrame(display_data)
-    
-    # Style the dataframe
-    styled_df = df_display.style.apply(
-        lambda x: ['background-color: #ffcccc' if '❌' in str(x['Status']) else '' for _ in x],
-        axis=1
+
+    # Display columns come straight from the pre-truncated frame; the
+    # keyword/reason summaries are the only per-row Python left
+    # Scores stay numeric (float32) and are formatted client-side via
+    # column_config; pre-formatting them to strings server-side meant a
+    # Python f-string per cell per rerun and a bigger Arrow payload.
+    # Low-cardinality columns go through the dictionary-encoded categorical
+    # Arrow type.
+    df_display = pd.DataFrame({
+        'Polymarket Question': sim_df['poly_question_short'],
+        'Kalshi Question': sim_df['kalshi_question_short'],
+        'Overall Score': sim_df['overall_score'].astype('float32'),
+        'Fuzzy': sim_df['fuzzy_score'].astype('float32'),
+        'Semantic': sim_df['semantic_score'].astype('float32'),
+        'Keyword': sim_df['keyword_score'].astype('float32'),
+        'Match Type': sim_df['match_type'].astype('category'),
+        'Common Keywords': [', '.join(kw[:3]) if len(kw) else 'None' for kw in sim_df['common_keywords']],
+        'Similarity Reasons': ['; '.join(r[:2]) if len(r) else 'None' for r in sim_df['similarity_reasons']],
+        'Status': pd.Categorical(np.where(sim_df['is_excluded'], '❌ Excluded', '✅ Active'))
+    }).reset_index(drop=True)
+
+    score_format = st.column_config.NumberColumn(format="%.3f")
+
+    # A row-wise Styler emits per-cell CSS that noticeably slows st.dataframe;
+    # the ❌/✅ markers in the Status column already carry the state
+    st.dataframe(
+        df_display,
+        use_container_width=True,
+        height=400,
+        column_config={
+            'Overall Score': score_format,
+            'Fuzzy': score_format,
+            'Semantic': score_format,
+            'Keyword': score_format,
+        }
     )
     
-    st.dataframe(styled_df, use_container_width=True, height=400)
-    
     # Expandable detailed view
     with st.expander("🔍 Detailed Analysis"):
+        # Build the option labels once instead of truncating per row inside
+        # the selectbox's format_func on every rerun
+        labels = (sim_df['polymarket_question'].str.slice(0, 50) + '... ↔ '
+                  + sim_df['kalshi_question'].str.slice(0, 50) + '...').tolist()
         selected_idx = st.selectbox(
             "Select a pair for detailed analysis:",
-            range(len(similarities)),
-            format_func=lambda x: f"{similarities[x]['polymarket_question'][:50]}... ↔ {similarities[x]['kalshi_question'][:50]}..."
+            range(len(sim_df)),
+            format_func=labels.__getitem__
         )
-        
+
         if selected_idx is not None:
-            render_detailed_similarity(similarities[selected_idx])
+            render_detailed_similarity(sim_df.iloc[selected_idx])
 
 
 def render_detailed_similarity(similarity):
@@ -472,18 +562,21 @@ def render_detailed_similarity(similarity):
     st.plotly_chart(fig_prices, use_container_width=True)
 
 
+@st.fragment
 def render_current_opportunities():
     """Render current arbitrage opportunities"""
     st.subheader("💰 Current Opportunities")
     
     # Get current opportunities from monitor
     try:
-        opportunities = monitor.get_current_opportunities()
+        opportunities = _cached_opportunities()
         
         if not opportunities:
             st.info("No arbitrage opportunities found at the moment.")
             return
-        
+
+        opp_df = pd.DataFrame(opportunities)
+
         # Filter controls
         col1, col2, col3 = st.columns(3)
         
@@ -499,7 +592,7 @@ def render_current_opportunities():
         with col2:
             strategy_filter = st.selectbox(
                 "Strategy",
-                options=["All"] + list(set(opp.get('strategy', '') for opp in opportunities)),
+                options=["All"] + opp_df['strategy'].dropna().unique().tolist(),
                 index=0
             )
         
@@ -510,23 +603,43 @@ def render_current_opportunities():
                 index=0
             )
         
-        # Filter opportunities
-        filtered_opportunities = []
-        for opp in opportunities:
-            if opp.get('profit_percentage', 0) * 100 >= min_profit:
-                if strategy_filter == "All" or opp.get('strategy') == strategy_filter:
-                    if outcome_filter == "All" or opp.get('outcome') == outcome_filter:
-                        filtered_opportunities.append(opp)
-        
-        if not filtered_opportunities:
+        # Filter with vectorized masks instead of a per-item Python loop
+        mask = opp_df['profit_percentage'].fillna(0) * 100 >= min_profit
+        if strategy_filter != "All":
+            mask &= opp_df['strategy'] == strategy_filter
+        if outcome_filter != "All":
+            mask &= opp_df['outcome'] == outcome_filter
+        filtered_df = opp_df[mask].sort_values('profit_percentage', ascending=False)
+
+        if filtered_df.empty:
             st.warning("No opportunities match the current filters.")
             return
-        
-        # Display opportunities
-        for i, opp in enumerate(filtered_opportunities):
-            with st.expander(f"💡 Opportunity {i+1}: {opp.get('profit_percentage', 0)*100:.1f}% profit", expanded=i<3):
-                render_opportunity_card(opp)
-                
+
+        # One expander per opportunity allocated ~15 widgets each and dominated
+        # rerun time; show every filtered row in a single dataframe (which
+        # virtualizes rows, so the full set costs the same as a page) and
+        # render the full card only for the row the user picks
+        filtered_df = filtered_df.reset_index(drop=True)
+
+        summary_cols = [col for col in (
+            'polymarket_question', 'kalshi_question', 'strategy', 'outcome',
+            'profit_percentage', 'profit_potential', 'confidence_score'
+        ) if col in filtered_df.columns]
+        st.dataframe(filtered_df[summary_cols], use_container_width=True)
+
+        # The detail picker sticks to the top rows by profit to keep its
+        # option list readable
+        top_df = filtered_df.head(20)
+
+        selected_opp = st.selectbox(
+            "Opportunity details:",
+            range(len(top_df)),
+            format_func=lambda i: f"💡 {top_df['profit_percentage'].iat[i]*100:.1f}% profit: {str(top_df['polymarket_question'].iat[i])[:50]}"
+        )
+
+        if selected_opp is not None:
+            render_opportunity_card(top_df.iloc[selected_opp])
+
     except Exception as e:
         st.error(f"Error loading opportunities: {e}")
 
@@ -594,6 +707,7 @@ def render_opportunity_card(opportunity):
         st.caption(f"Detected at: {detected_at}")
 
 
+@st.fragment
 def render_performance_metrics():
     """Render performance metrics"""
     st.subheader("📈 Performance Metrics")
@@ -607,7 +721,7 @@ def render_performance_metrics():
     )
     
     # Get metrics
-    metrics = monitor.get_performance_metrics(time_period)
+    metrics = _cached_metrics(time_period)
     
     if not metrics:
         st.info("No performance data available")
@@ -641,57 +755,53 @@ def render_performance_metrics():
         st.metric("Timeframe", f"{time_period} hours")
 
 
+@st.fragment
 def render_historical_analysis():
     """Render historical analysis charts"""
     st.subheader("📊 Historical Analysis")
     
     # Get historical data from database
-    db = DatabaseManager()
-    recent_opportunities = db.get_recent_opportunities(limit=100)
+    recent_opportunities = _cached_recent_opportunities(limit=100)
     
     if not recent_opportunities:
         st.info("No historical data available")
         return
     
-    # Convert to DataFrame
-    df_data = []
-    for opp in recent_opportunities:
-        df_data.append({
-            "detected_at": opp.detected_at,
-            "profit_percentage": opp.profit_percentage,
-            "profit_potential": opp.profit_potential,
-            "strategy": opp.strategy,
-            "outcome": opp.outcome,
-            "confidence_score": opp.confidence_score,
-            "platform_pair": f"{opp.polymarket_id[:8]}...{opp.kalshi_id[:8]}"
-        })
-    
-    df = pd.DataFrame(df_data)
-    
+    # Convert to DataFrame column-wise rather than one dict per row
+    df = pd.DataFrame({
+        "detected_at": pd.to_datetime([opp.detected_at for opp in recent_opportunities], utc=True),
+        "profit_percentage": [opp.profit_percentage for opp in recent_opportunities],
+        "profit_potential": [opp.profit_potential for opp in recent_opportunities],
+        "strategy": [opp.strategy for opp in recent_opportunities],
+        "outcome": [opp.outcome for opp in recent_opportunities],
+        "confidence_score": [opp.confidence_score for opp in recent_opportunities],
+        "platform_pair": [f"{opp.polymarket_id[:8]}...{opp.kalshi_id[:8]}" for opp in recent_opportunities]
+    })
+
     # Time series chart
     st.subheader("📈 Opportunities Over Time")
-    
-    # Group by hour
-    df['hour'] = df['detected_at'].dt.floor('H')
-    hourly_stats = df.groupby('hour').agg({
-        'profit_percentage': ['count', 'mean', 'sum'],
-        'profit_potential': 'sum'
-    }).reset_index()
-    
-    # Flatten column names
-    hourly_stats.columns = ['hour', 'opportunity_count', 'avg_profit_pct', 'total_profit_pct', 'total_profit_potential']
+
+    # Group by hour with named aggregation; avoids the MultiIndex columns
+    # that previously had to be flattened by hand
+    df['hour'] = df['detected_at'].dt.floor('h')
+    hourly_stats = df.groupby('hour', as_index=False).agg(
+        opportunity_count=('profit_percentage', 'count'),
+        avg_profit_pct=('profit_percentage', 'mean'),
+        total_profit_pct=('profit_percentage', 'sum'),
+        total_profit_potential=('profit_potential', 'sum')
+    )
     
     # Create time series chart
     fig = go.Figure()
     
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=hourly_stats['hour'],
         y=hourly_stats['opportunity_count'],
         name='Opportunities Count',
         line=dict(color='blue')
     ))
-    
-    fig.add_trace(go.Scatter(
+
+    fig.add_trace(go.Scattergl(
         x=hourly_stats['hour'],
         y=hourly_stats['avg_profit_pct'] * 100,
         name='Avg Profit %',
@@ -714,32 +824,18 @@ def render_historical_analysis():
     
     col1, col2 = st.columns(2)
     
+    # Native st.bar_chart ships a tiny Vega-Lite spec instead of a full
+    # plotly figure; plotly stays reserved for the interactive time series
     with col1:
-        strategy_counts = df['strategy'].value_counts()
-        fig_strategy = px.pie(
-            values=strategy_counts.values,
-            names=strategy_counts.index,
-            title='Opportunities by Strategy'
-        )
-        st.plotly_chart(fig_strategy, use_container_width=True)
-    
+        st.caption("Opportunities by Strategy")
+        st.bar_chart(df['strategy'].value_counts())
+
     with col2:
-        outcome_counts = df['outcome'].value_counts()
-        fig_outcome = px.pie(
-            values=outcome_counts.values,
-            names=outcome_counts.index,
-            title='Opportunities by Outcome'
-        )
-        st.plotly_chart(fig_outcome, use_container_width=True)
-    
+        st.caption("Opportunities by Outcome")
+        st.bar_chart(df['outcome'].value_counts())
+
     # Profit distribution
     st.subheader("💰 Profit Distribution")
-    
-    fig_profit = px.histogram(
-        df,
-        x='profit_percentage',
-        nbins=20,
-        title='Distribution of Profit Percentages',
-        labels={'profit_percentage': 'Profit Percentage', 'count': 'Frequency'}
-    )
-    st.plotly_chart(fig_profit, use_container_width=True)
+
+    counts, edges = np.histogram(df['profit_percentage'], bins=20)
+    st.bar_chart(pd.Series(counts, index=edges[:-1].round(3), name='Frequency'))
@@ -2,7 +2,10 @@
 CSS styles for the trading markets dashboard
 """
 
-ULTRA_COMPACT_CSS = """
+import re
+from functools import lru_cache
+
+_RAW_CSS = """
 <style>
     /* Overall app styling */
     .main .block-container {
@@ -25,10 +28,10 @@ ULTRA_COMPACT_CSS = """
         box-shadow: 0 2px 5px rgba(0,0,0,0.2);
     }
     
-    /* Improve metrics display */
+    /* Improve metrics display (transparent to match the screenshot look) */
     .stMetric {
-        background-color: rgba(30, 30, 30, 0.6);
-        padding: 0.1rem;
+        background-color: transparent !important;
+        padding: 0.2rem 0 !important;
         border-radius: 0.2rem;
         margin-bottom: 0.1rem;
     }
@@ -41,20 +44,20 @@ ULTRA_COMPACT_CSS = """
         background-color: rgba(30, 30, 30, 0.6);
     }
     
-    .stExpander > div > div > div {
+    /* Target the stable test-id rather than a deep div chain; selectors are
+       matched right-to-left, so a bare `div` right-hand side forces the
+       engine to consider every div on the page */
+    .stExpander [data-testid="stExpanderDetails"] {
         padding: 0.25rem !important;
     }
-    
-    /* Better metric styling */
+
+    /* Better metric styling; color inherits to the inner value/label */
     div[data-testid="metric-container"] {
         background-color: rgba(30, 30, 30, 0.6);
         border: 1px solid rgba(100,100,100,0.15);
         padding: 0.15rem;
         border-radius: 0.25rem;
         box-shadow: 0 2px 4px rgba(0,0,0,0.2);
-    }
-    
-    div[data-testid="metric-container"] > div {
         color: #FFFFFF;
     }
     
@@ -75,10 +78,10 @@ ULTRA_COMPACT_CSS = """
     }
     
     h3 {
-        font-size: 1rem !important;
-        color: #FFFFFF;
-        margin-top: 0.4rem;
-        margin-bottom: 0.3rem;
+        font-size: 0.9rem !important;
+        color: #FAFAFA;
+        margin-top: 0.1rem !important;
+        margin-bottom: 0.05rem !important;
         font-weight: 500;
     }
     
@@ -134,19 +137,6 @@ ULTRA_COMPACT_CSS = """
         fill: white !important;
     }
     
-    /* Style the metrics to look like the screenshot */
-    .stMetric {
-        background-color: transparent !important;
-        padding: 0.2rem 0 !important;
-    }
-        color: #FAFAFA;
-    }
-    h3 {
-        font-size: 0.9rem !important;
-        margin-bottom: 0.05rem !important;
-        margin-top: 0.1rem !important;
-        color: #FAFAFA;
-    }
     .stSelectbox > div > div {
         padding: 0.05rem;
         background-color: rgba(255, 255, 255, 0.01);
@@ -188,3 +178,16 @@ ULTRA_COMPACT_CSS = """
         padding: 0.05rem !important;
     }
 </style>"""
+
+
+@lru_cache(maxsize=1)
+def _minify_css():
+    """Strip comments and collapse whitespace once per process"""
+    css = re.sub(r"/\*.*?\*/", "", _RAW_CSS, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{}:;,])\s*", r"\1", css)
+    return css.strip()
+
+
+# The raw block above stays readable; reruns ship this minified copy
+ULTRA_COMPACT_CSS = _minify_css()
@@ -2,38 +2,77 @@
 Utility functions for formatting and data processing
 """
 
+import bisect
+import sys
+from datetime import datetime
+from functools import lru_cache
+
+# Pre-resolved at import so the per-row hot path skips the attribute lookup
+_fromiso = datetime.fromisoformat
+
+# 3.11+ parses a trailing 'Z' natively, so the replace() allocation per row
+# is only needed on older interpreters
+_FROMISO_HANDLES_Z = sys.version_info >= (3, 11)
+
+# Dispatch table indexed by bisect instead of chained if/elif; called once
+# per market row on every render
+_VOLUME_THRESHOLDS = (1_000, 1_000_000)
+_VOLUME_FORMATTERS = (
+    lambda v: f"${v:.0f}",
+    lambda v: f"${v/1_000:.1f}K",
+    lambda v: f"${v/1_000_000:.1f}M",
+)
+
+
+@lru_cache(maxsize=1024)
 def format_volume(volume):
     """Format volume numbers for display"""
-    if volume >= 1_000_000:
-        return f"${volume/1_000_000:.1f}M"
-    elif volume >= 1_000:
-        return f"${volume/1_000:.1f}K"
-    else:
-        return f"${volume:.0f}"
+    return _VOLUME_FORMATTERS[bisect.bisect_right(_VOLUME_THRESHOLDS, volume)](volume)
 
+@lru_cache(maxsize=4096)
 def format_price(price):
     """Format price as percentage"""
     if price is None:
         return "N/A"
-    return f"{price*100:.1f}¢"
+    return "%.1f¢" % (price * 100)
+
+_PLATFORM_ICONS = {"Polymarket": "🟣"}
+
+# Indexed by sign of (yes_price - 0.5): down, flat, up
+_TREND_ICONS = ("📉", "➡️", "📈")
+
 
 def get_platform_icon(platform):
     """Get icon for platform"""
-    return "🟣" if platform == "Polymarket" else "🔵"
+    return _PLATFORM_ICONS.get(platform, "🔵")
 
 def get_trend_icon(yes_price):
     """Get trend icon based on yes price"""
-    return "📈" if yes_price > 0.5 else "📉" if yes_price < 0.5 else "➡️"
+    return _TREND_ICONS[(yes_price > 0.5) - (yes_price < 0.5) + 1]
 
 def format_end_date(end_date):
     """Format end date for display"""
-    from datetime import datetime
-    
     if end_date and end_date != 'Unknown':
         try:
-            parsed_date = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
-            return parsed_date.strftime('%m/%d')
+            if _FROMISO_HANDLES_Z:
+                parsed_date = _fromiso(end_date)
+            else:
+                parsed_date = _fromiso(end_date.replace('Z', '+00:00'))
+            # Fixed-format output; skips strftime's locale machinery
+            return f"{parsed_date.month:02d}/{parsed_date.day:02d}"
         except:
             return "?"
     else:
         return "?"
+
+def format_end_dates(series):
+    """Format a whole column of ISO end dates in one vectorized pass.
+
+    Batch counterpart to format_end_date for DataFrame-based views: pandas
+    parses the column in C instead of one fromisoformat call (plus exception
+    handling) per row. Unparseable or missing dates come back as '?'.
+    """
+    import pandas as pd
+
+    parsed = pd.to_datetime(series, utc=True, errors='coerce')
+    return parsed.dt.strftime('%m/%d').fillna('?')
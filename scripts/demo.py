@@ -3,14 +3,49 @@
 Demo script for the arbitrage platform
 """
 
-import os
 import sys
 from pathlib import Path
 
-# Add the project root to Python path
+# Add the project root to Python path so the script works from a plain
+# checkout (pip install -r requirements.txt) without pip install -e .
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# Sample matcher fixtures, built once at module load. The '_tokens'
+# frozensets let MarketMatcher take its set-intersection keyword fast path
+# instead of cleaning and tokenizing each question per compared pair.
+SAMPLE_POLY_MARKETS = (
+    {
+        "id": "poly_1",
+        "question": "Will Donald Trump win the 2024 US Presidential Election?",
+        "volume_24hr": 1000,
+        "_tokens": frozenset(("donald", "trump", "win", "24", "us",
+                              "presidential", "election?")),
+    },
+    {
+        "id": "poly_2",
+        "question": "Will the Democrats control the House after 2024?",
+        "volume_24hr": 500,
+        "_tokens": frozenset(("democrats", "control", "house", "after", "24?")),
+    },
+)
+
+SAMPLE_KALSHI_MARKETS = (
+    {
+        "id": "PRES-24",
+        "question": "Will Trump be President in 2024?",
+        "volume_24hr": 800,
+        "_tokens": frozenset(("trump", "president", "24?")),
+    },
+    {
+        "id": "HOUSE-24",
+        "question": "Will Democrats control House in 2024?",
+        "volume_24hr": 600,
+        "_tokens": frozenset(("democrats", "control", "house", "24?")),
+    },
+)
+
+
 def test_configuration():
     """Test configuration system"""
     print("🔧 Testing configuration system...")
@@ -18,15 +53,14 @@ def test_configuration():
     try:
         from backend.core.config import config
         
-        # Test basic configuration access
-        min_profit = config.get("arbitrage.min_profit_threshold", 0.05)
-        print(f"   - Min profit threshold: {min_profit}")
-        
-        poly_fee = config.get("platforms.polymarket.fee_rate", 0.02)
-        print(f"   - Polymarket fee rate: {poly_fee}")
-        
-        kalshi_fee = config.get("platforms.kalshi.fee_rate", 0.01)
-        print(f"   - Kalshi fee rate: {kalshi_fee}")
+        # Test basic configuration access; one loop over the key table
+        checks = (
+            ("Min profit threshold", "arbitrage.min_profit_threshold", 0.05),
+            ("Polymarket fee rate", "platforms.polymarket.fee_rate", 0.02),
+            ("Kalshi fee rate", "platforms.kalshi.fee_rate", 0.01),
+        )
+        for label, key, default in checks:
+            print(f"   - {label}: {config.get(key, default)}")
         
         print("✅ Configuration system working")
         return True
@@ -42,35 +76,9 @@ def test_market_matching():
     try:
         from backend.core.market_matcher import MarketMatcher
         
-        # Sample market data
-        poly_markets = [
-            {
-                "id": "poly_1",
-                "question": "Will Donald Trump win the 2024 US Presidential Election?",
-                "volume_24hr": 1000
-            },
-            {
-                "id": "poly_2", 
-                "question": "Will the Democrats control the House after 2024?",
-                "volume_24hr": 500
-            }
-        ]
-        
-        kalshi_markets = [
-            {
-                "id": "PRES-24",
-                "question": "Will Trump be President in 2024?",
-                "volume_24hr": 800
-            },
-            {
-                "id": "HOUSE-24",
-                "question": "Will Democrats control House in 2024?",
-                "volume_24hr": 600
-            }
-        ]
-        
         matcher = MarketMatcher()
-        matches = matcher.find_equivalent_markets(poly_markets, kalshi_markets)
+        matches = matcher.find_equivalent_markets(list(SAMPLE_POLY_MARKETS),
+                                                  list(SAMPLE_KALSHI_MARKETS))
         
         print(f"   - Found {len(matches)} matches")
         for match in matches:
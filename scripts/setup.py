@@ -3,25 +3,30 @@
 Setup script for the arbitrage platform
 """
 
-import os
 import sys
 import logging
 from pathlib import Path
 
-# Add the project root to Python path
+# Add the project root to Python path so the script works from a plain
+# checkout (pip install -r requirements.txt) without pip install -e .
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-try:
-    from backend.data.database import DatabaseManager
-    from backend.core.config import config
-    from backend.core.monitor import monitor
-    print("✅ All backend modules loaded successfully")
-except ImportError as e:
-    print(f"❌ Error importing backend modules: {e}")
-    print("Make sure you have installed all dependencies:")
-    print("pip install -r requirements.txt")
-    sys.exit(1)
+# Backend modules are imported inside each test function so an early exit
+# doesn't pull in sqlalchemy, requests and the monitor thread.
+
+# The matching and arbitrage tests hit the same market endpoints with the
+# same params; fetch once per platform for the whole setup run and slice
+_market_cache = {}
+
+
+def _cached_markets(api, limit=5):
+    """Fetch an API's market list once per (platform, limit) and reuse it"""
+    key = (type(api).__name__, limit)
+    if key not in _market_cache:
+        _market_cache[key] = api.get_markets(limit=limit)
+    return _market_cache[key]
+
 
 def setup_logging():
     """Setup logging configuration"""
@@ -38,9 +43,16 @@ def setup_database():
     """Initialize the database"""
     print("🗄️  Setting up database...")
     try:
+        from backend.data.database import DatabaseManager
+
         db = DatabaseManager()
         print("✅ Database initialized successfully")
         return True
+    except ImportError as e:
+        print(f"❌ Error importing backend modules: {e}")
+        print("Make sure you have installed all dependencies:")
+        print("pip install -r requirements.txt")
+        return False
     except Exception as e:
         print(f"❌ Database setup failed: {e}")
         return False
@@ -50,27 +62,34 @@ def test_apis():
     print("🔌 Testing API connections...")
     
     try:
+        from concurrent.futures import ThreadPoolExecutor
+
         from backend.polymarket_api import PolymarketAPI
         from backend.kalshi_api import KalshiAPI
-        
-        # Test Polymarket API
+
         poly_api = PolymarketAPI()
-        poly_markets = poly_api.get_markets(limit=2)
+        kalshi_api = KalshiAPI()
+
+        # Both probes are network-bound, so overlap them; wall time becomes
+        # the slower of the two instead of their sum
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            poly_future = executor.submit(poly_api.get_markets, limit=2)
+            kalshi_future = executor.submit(kalshi_api.get_markets, limit=2)
+            poly_markets = poly_future.result()
+            kalshi_markets = kalshi_future.result()
+
         if poly_markets:
             print("✅ Polymarket API connection successful")
         else:
             print("⚠️  Polymarket API connection failed or returned no data")
-        
-        # Test Kalshi API
-        kalshi_api = KalshiAPI()
-        kalshi_markets = kalshi_api.get_markets(limit=2)
+
         if kalshi_markets:
             print("✅ Kalshi API connection successful")
         else:
             print("⚠️  Kalshi API connection failed or returned no data")
-            
+
         return True
-        
+
     except Exception as e:
         print(f"❌ API test failed: {e}")
         return False
@@ -88,8 +107,9 @@ def test_market_matching():
         poly_api = PolymarketAPI()
         kalshi_api = KalshiAPI()
         
-        poly_markets = poly_api.get_markets(limit=3)
-        kalshi_markets = kalshi_api.get_markets(limit=3)
+        # Request the larger limit shared with the arbitrage test and slice
+        poly_markets = _cached_markets(poly_api)[:3]
+        kalshi_markets = _cached_markets(kalshi_api)[:3]
         
         if not poly_markets or not kalshi_markets:
             print("⚠️  Could not get sample markets for testing")
@@ -126,8 +146,8 @@ def test_arbitrage_detection():
         poly_api = PolymarketAPI()
         kalshi_api = KalshiAPI()
         
-        poly_markets = poly_api.get_markets(limit=5)
-        kalshi_markets = kalshi_api.get_markets(limit=5)
+        poly_markets = _cached_markets(poly_api)
+        kalshi_markets = _cached_markets(kalshi_api)
         
         if not poly_markets or not kalshi_markets:
             print("⚠️  Could not get sample markets for testing")
@@ -167,6 +187,8 @@ def test_monitoring():
     print("📊 Testing monitoring system...")
     
     try:
+        from backend.core.monitor import monitor
+
         # Test monitoring status
         status = monitor.get_monitoring_status()
         print(f"✅ Monitoring system accessible")
@@ -2,22 +2,31 @@
 Main entry point for Streamlit Community Cloud deployment
 """
 
-import sys
-import os
+import streamlit as st
 
-# Add the project root to the Python path
-project_root = os.path.dirname(os.path.abspath(__file__))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+# Configure the page and inject the CSS before frontend.app renders any
+# widget, so the first paint is already styled instead of flashing an
+# unstyled skeleton and repainting
+st.set_page_config(
+    page_title="Trading Markets Dashboard",
+    page_icon="📊",
+    layout="wide"
+)
 
-# Now we can import from frontend
+# The project is an installable package (pip install -e .), so frontend
+# resolves through the normal finder cache without sys.path mutation
 try:
+    from frontend.styles import ULTRA_COMPACT_CSS
+
+    # Re-inject on every run: Streamlit prunes elements that are not
+    # re-emitted, and frontend.app's module-level injection only fires on
+    # the run that first imports it
+    st.markdown(ULTRA_COMPACT_CSS, unsafe_allow_html=True)
+
     from frontend.app import main
-    
+
     if __name__ == "__main__":
         main()
 except ImportError as e:
-    # Fallback: try to import and run directly
-    import streamlit as st
     st.error(f"Import error: {e}")
     st.info("Please ensure all dependencies are installed: pip install -r requirements.txt")